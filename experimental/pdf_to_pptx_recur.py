@@ -29,17 +29,27 @@ Environment Variables (loaded from .env):
 
 import os
 import sys
+import atexit
+import itertools
+import shutil
 import logging
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+# Resolve script-relative paths once at import time
+_SCRIPT_DIR = Path(__file__).resolve().parent
+# Match the path calculation used by file_parser_service.py: two levels above this script
+_PROJECT_ROOT = _SCRIPT_DIR.parent.parent
+_DEFAULT_UPLOAD_ROOT = _PROJECT_ROOT / 'uploads'
 
 # Add the current directory to the path for imports
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(_SCRIPT_DIR))
 
 # Load environment variables from .env
 from dotenv import load_dotenv
-load_dotenv(script_dir / '.env')
+load_dotenv(_SCRIPT_DIR / '.env')
 
 # Setup logging
 logging.basicConfig(
@@ -49,70 +59,307 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def pdf_to_images(pdf_path: str, output_dir: str) -> List[str]:
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Environment settings, read once after .env has been loaded"""
+    mineru_token: Optional[str]
+    mineru_api_base: str
+    upload_folder: Optional[str]
+    volcengine_access_key: Optional[str]
+    volcengine_secret_key: Optional[str]
+    baidu_ocr_api_key: Optional[str]
+    baidu_ocr_api_secret: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> 'EnvConfig':
+        return cls(
+            mineru_token=os.getenv('MINERU_TOKEN'),
+            mineru_api_base=os.getenv('MINERU_API_BASE', 'https://mineru.net'),
+            upload_folder=os.getenv('UPLOAD_FOLDER'),
+            volcengine_access_key=os.getenv('VOLCENGINE_ACCESS_KEY'),
+            volcengine_secret_key=os.getenv('VOLCENGINE_SECRET_KEY'),
+            baidu_ocr_api_key=os.getenv('BAIDU_OCR_API_KEY'),
+            baidu_ocr_api_secret=os.getenv('BAIDU_OCR_API_SECRET'),
+        )
+
+    @property
+    def baidu_ocr_enabled(self) -> bool:
+        return bool(self.baidu_ocr_api_key)
+
+
+ENV = EnvConfig.from_env()
+
+
+# Rendering is CPU-bound and PyMuPDF holds the GIL, so pages are rendered in
+# worker processes; beyond ~6 workers the speedup flattens out.
+MAX_RENDER_WORKERS = 6
+
+# Emit a rendering progress line every N pages instead of one per page
+RENDER_PROGRESS_INTERVAL = 10
+
+# PDF user space is 72 units per inch, so rendering at 72 DPI keeps the native page size
+NATIVE_PDF_DPI = 72
+
+
+# Render state owned by each worker process (see _init_render_worker)
+_worker_doc = None
+_worker_colorspace = None
+_worker_matrix = None
+
+
+def _init_render_worker(pdf_path: str, dpi: int) -> None:
     """
-    Convert PDF to images using PyMuPDF
+    Open the PDF once per worker process instead of once per page
+
+    MuPDF contexts are not safe to share across threads, so each process keeps
+    its own independent document handle for the lifetime of the pool.
+    """
+    import fitz  # PyMuPDF
+
+    global _worker_doc, _worker_colorspace, _worker_matrix
+    _worker_doc = fitz.open(pdf_path)
+    _worker_colorspace = fitz.csRGB
+    zoom = dpi / NATIVE_PDF_DPI
+    _worker_matrix = fitz.Matrix(zoom, zoom)
+
+
+def _render_page(task: Tuple[int, str]) -> Tuple[str, Tuple[int, int]]:
+    """
+    Render a single PDF page to PNG (runs in a worker process)
+
+    Args:
+        task: (page_index, img_path)
+
+    Returns:
+        (image_path, (width, height)) of the generated image
+    """
+    from PIL import Image
+
+    page_index, img_path = task
+    # Explicit RGB without alpha: 3 bytes/pixel, matching the "RGB" frombytes below
+    pix = _worker_doc[page_index].get_pixmap(
+        matrix=_worker_matrix, colorspace=_worker_colorspace, alpha=False
+    )
+
+    # Encode via Pillow with fast deflate: pix.save() uses libpng's default
+    # compression, which dominates render time and buys nothing downstream.
+    Image.frombytes("RGB", (pix.width, pix.height), pix.samples).save(
+        img_path, "PNG", compress_level=1
+    )
+    return img_path, (pix.width, pix.height)
+
+
+class RenderedPages:
+    """
+    Pages of a PDF being rendered to images by a background process pool
+
+    Iterating yields (image_path, (width, height)) for each page, in page order, as
+    soon as that page is saved. close() shuts the pool down and cancels pages that
+    have not started rendering; it must be called even if the pages are never
+    iterated, so use the object as a context manager.
+    """
+
+    def __init__(self, executor, rendered: Iterator[Tuple[str, Tuple[int, int]]], page_count: int, output_dir: str):
+        self._executor = executor
+        self._rendered = rendered
+        self.page_count = page_count
+        self._output_dir = output_dir
+
+    def __iter__(self) -> Iterator[Tuple[str, Tuple[int, int]]]:
+        for i, (img_path, page_size) in enumerate(self._rendered):
+            if (i + 1) % RENDER_PROGRESS_INTERVAL == 0 or i + 1 == self.page_count:
+                logger.info(f"  Saved {i+1}/{self.page_count} pages to {self._output_dir}")
+            yield img_path, page_size
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> "RenderedPages":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def iter_pdf_images(
+    pdf_path: str,
+    output_dir: str,
+    max_workers: int = MAX_RENDER_WORKERS,
+    dpi: int = NATIVE_PDF_DPI
+) -> RenderedPages:
+    """
+    Convert PDF to images using PyMuPDF, yielding each path as soon as its page is saved
+
+    Pages are rendered in parallel by a process pool and yielded in page order, so
+    a consumer can start working on page N while later pages are still rendering.
+    Rendering starts when this function is called, not on first iteration, so the
+    caller can do other setup while the worker processes are busy. The caller owns
+    the pool: close the result (or use it in a ``with`` block) once done with it.
 
     Args:
         pdf_path: Path to input PDF file
         output_dir: Directory to save output images
+        max_workers: Upper bound on rendering processes (default: 6)
+        dpi: Rendering resolution (default: 72, the PDF's native page size)
 
     Returns:
-        List of paths to generated images
+        RenderedPages iterating (image_path, (width, height)) for each page, in page order
     """
     import fitz  # PyMuPDF
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
 
     os.makedirs(output_dir, exist_ok=True)
-    doc = fitz.open(pdf_path)
-    image_paths = []
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+
+    logger.info(f"  PDF has {page_count} pages")
+
+    # Join the directory once; per-page paths are plain string concatenation
+    path_prefix = os.fspath(output_dir).rstrip(os.sep) + os.sep
+    tasks = [(i, f"{path_prefix}page_{i:03d}.png") for i in range(page_count)]
+    num_workers = max(1, min(os.cpu_count() or 1, max_workers, page_count))
+
+    # Spawned (not forked) workers, as in pdf_to_pptx.py: the caller keeps working
+    # while the pool is live, and a forked child would inherit any lock another
+    # thread happened to hold at that moment with no owner left to release it.
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_worker,
+        initargs=(pdf_path, dpi)
+    )
+    # map() submits every page up front, so the workers start rendering right away
+    return RenderedPages(executor, executor.map(_render_page, tasks), page_count, output_dir)
+
+
+def pdf_to_images(
+    pdf_path: str,
+    output_dir: str,
+    max_workers: int = MAX_RENDER_WORKERS,
+    dpi: int = NATIVE_PDF_DPI
+) -> Tuple[List[str], Tuple[int, int]]:
+    """
+    Convert PDF to images using PyMuPDF
 
-    logger.info(f"  PDF has {len(doc)} pages")
+    Args:
+        pdf_path: Path to input PDF file
+        output_dir: Directory to save output images
+        max_workers: Upper bound on rendering processes (default: 6)
+        dpi: Rendering resolution (default: 72, the PDF's native page size)
 
-    for i, page in enumerate(doc):
-        # Render at native PDF size to preserve original page dimensions
-        pix = page.get_pixmap()
-        img_path = os.path.join(output_dir, f"page_{i:03d}.png")
-        pix.save(img_path)
-        image_paths.append(img_path)
-        logger.info(f"  Saved page {i+1}/{len(doc)}: {img_path}")
+    Returns:
+        (image_paths, (width, height)) - generated image paths and the pixel size of the first page
+    """
+    image_paths = []
+    first_page_size = None
+    with iter_pdf_images(pdf_path, output_dir, max_workers=max_workers, dpi=dpi) as rendered_pages:
+        for img_path, page_size in rendered_pages:
+            if first_page_size is None:
+                first_page_size = page_size
+            image_paths.append(img_path)
+    return image_paths, first_page_size
 
-    doc.close()
-    return image_paths
 
+# RAM-backed scratch space (Linux tmpfs) for page images that are not kept
+_RAM_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+# Images written to the scratch directory per page (page PNG)
+SCRATCH_IMAGES_PER_PAGE = 1
 
-def check_environment():
+
+def _estimate_scratch_bytes(pdf_path: str, dpi: int) -> int:
     """
-    Check that required environment variables are set and log status of optional ones.
+    Rough upper bound on scratch space: every image as raw RGB at the first page's size
+    """
+    import fitz  # PyMuPDF
+
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+        if not page_count:
+            return 0
+        rect = doc[0].rect
+    zoom = dpi / NATIVE_PDF_DPI
+    page_bytes = int(rect.width * zoom) * int(rect.height * zoom) * 3
+    return page_bytes * page_count * SCRATCH_IMAGES_PER_PAGE
+
+
+def make_scratch_images_dir(prefix: str, pdf_path: str, dpi: int) -> Path:
     """
-    # Required
-    mineru_token = os.getenv('MINERU_TOKEN')
-    volcengine_ak = os.getenv('VOLCENGINE_ACCESS_KEY')
-    volcengine_sk = os.getenv('VOLCENGINE_SECRET_KEY')
+    Create a temporary directory for page images, on tmpfs when it has room
 
-    # Optional
-    baidu_api_key = os.getenv('BAIDU_OCR_API_KEY')
-    baidu_api_secret = os.getenv('BAIDU_OCR_API_SECRET')
+    Rendered pages are only read back by later pipeline steps, so keeping them in
+    RAM avoids a write-then-read round trip through the disk. tmpfs is often small
+    (64 MB by default in Docker), so when the estimated output does not fit, the
+    directory goes to the regular temp dir (TMPDIR) instead. The directory is
+    removed when the process exits, including on failure.
 
+    Args:
+        prefix: Name prefix for the directory (typically the input PDF name)
+        pdf_path: PDF that will be rendered into the directory
+        dpi: Rendering resolution
+
+    Returns:
+        Path to the new directory
+    """
+    scratch_root = _RAM_TMP_DIR
+    if scratch_root is not None:
+        needed = _estimate_scratch_bytes(pdf_path, dpi)
+        free = shutil.disk_usage(scratch_root).free
+        if needed > free:
+            logger.info(
+                f"  {scratch_root} has {free >> 20} MB free but ~{needed >> 20} MB may be needed; "
+                f"using {tempfile.gettempdir()} for page images"
+            )
+            scratch_root = None
+
+    images_dir = Path(tempfile.mkdtemp(prefix=f"{prefix}_images_", dir=scratch_root))
+    atexit.register(shutil.rmtree, images_dir, ignore_errors=True)
+    return images_dir
+
+
+def check_environment() -> EnvConfig:
+    """
+    Check that required environment variables are set and log status of optional ones.
+    """
     logger.info("Environment check:")
-    logger.info(f"  MINERU_TOKEN: {'Set' if mineru_token else 'NOT SET (required)'}")
-    logger.info(f"  VOLCENGINE_ACCESS_KEY: {'Set' if volcengine_ak else 'NOT SET (required)'}")
-    logger.info(f"  VOLCENGINE_SECRET_KEY: {'Set' if volcengine_sk else 'NOT SET (required)'}")
-    logger.info(f"  BAIDU_OCR_API_KEY: {'Set (table OCR enabled)' if baidu_api_key else 'Not set (table OCR disabled)'}")
-    logger.info(f"  BAIDU_OCR_API_SECRET: {'Set' if baidu_api_secret else 'Not set'}")
+    logger.info(f"  MINERU_TOKEN: {'Set' if ENV.mineru_token else 'NOT SET (required)'}")
+    logger.info(f"  VOLCENGINE_ACCESS_KEY: {'Set' if ENV.volcengine_access_key else 'NOT SET (required)'}")
+    logger.info(f"  VOLCENGINE_SECRET_KEY: {'Set' if ENV.volcengine_secret_key else 'NOT SET (required)'}")
+    logger.info(f"  BAIDU_OCR_API_KEY: {'Set (table OCR enabled)' if ENV.baidu_ocr_api_key else 'Not set (table OCR disabled)'}")
+    logger.info(f"  BAIDU_OCR_API_SECRET: {'Set' if ENV.baidu_ocr_api_secret else 'Not set'}")
 
-    if not mineru_token:
+    if not ENV.mineru_token:
         raise ValueError("MINERU_TOKEN not configured in .env file")
-    if not volcengine_ak or not volcengine_sk:
+    if not ENV.volcengine_access_key or not ENV.volcengine_secret_key:
         raise ValueError("VOLCENGINE credentials not configured in .env file")
 
-    return {
-        'mineru_token': mineru_token,
-        'mineru_api_base': os.getenv('MINERU_API_BASE', 'https://mineru.net'),
-        'baidu_ocr_enabled': bool(baidu_api_key)
-    }
+    return ENV
 
 
-def main(pdf_path: str, output_dir: str = None, max_depth: int = 3, max_workers: int = 4):
+def _lazy_imports():
+    """
+    Import the pipeline services on demand.
+
+    These pull in python-pptx, lxml, PIL and numpy, which take hundreds of
+    milliseconds to load; deferring them lets validation failures exit quickly.
+
+    Returns:
+        (get_image_editability_service, ExportService)
+    """
+    from image_editability_service import get_image_editability_service
+    from export_service import ExportService
+
+    return get_image_editability_service, ExportService
+
+
+def main(
+    pdf_path: str,
+    output_dir: str = None,
+    max_depth: int = 3,
+    max_workers: int = 4,
+    dpi: int = NATIVE_PDF_DPI,
+    keep_images: bool = False
+):
     """
     Main conversion pipeline using recursive analysis
 
@@ -121,11 +368,9 @@ def main(pdf_path: str, output_dir: str = None, max_depth: int = 3, max_workers:
         output_dir: Output directory (default: ./output_files)
         max_depth: Maximum recursion depth for element extraction (default: 3)
         max_workers: Number of parallel workers for image processing (default: 4)
+        dpi: Page rendering resolution (default: 72, the PDF's native page size)
+        keep_images: Keep page images in <output_dir>/images instead of a temporary directory
     """
-    from PIL import Image
-    from image_editability_service import get_image_editability_service
-    from export_service import ExportService
-
     # Validate input file exists
     if not os.path.exists(pdf_path):
         logger.error(f"Input file not found: {pdf_path}")
@@ -134,24 +379,29 @@ def main(pdf_path: str, output_dir: str = None, max_depth: int = 3, max_workers:
     # Check environment
     env_config = check_environment()
 
+    # Only pay for the heavy imports once the inputs are known to be usable
+    get_image_editability_service, ExportService = _lazy_imports()
+
     # Setup output directories
     if output_dir is None:
-        output_dir = script_dir / "output_files"
+        output_dir = _SCRIPT_DIR / "output_files"
     else:
         output_dir = Path(output_dir)
-    images_dir = output_dir / "images"
-    os.makedirs(images_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
 
     # Derive output filename from input
     pdf_name = Path(pdf_path).stem
+
+    if keep_images:
+        images_dir = output_dir / "images"
+        os.makedirs(images_dir, exist_ok=True)
+    else:
+        images_dir = make_scratch_images_dir(pdf_name, pdf_path, dpi)
+
     output_pptx = output_dir / f"{pdf_name}.pptx"
 
     # Determine upload folder (for MinerU results)
-    upload_folder = os.getenv('UPLOAD_FOLDER')
-    if not upload_folder:
-        # Match the path calculation used by file_parser_service.py
-        project_root = script_dir.parent.parent
-        upload_folder = str(project_root / 'uploads')
+    upload_folder = env_config.upload_folder or str(_DEFAULT_UPLOAD_ROOT)
 
     logger.info("=" * 60)
     logger.info("PDF to Editable PPTX Converter (Recursive Analysis)")
@@ -160,73 +410,103 @@ def main(pdf_path: str, output_dir: str = None, max_depth: int = 3, max_workers:
     logger.info(f"Output directory: {output_dir}")
     logger.info(f"Max recursion depth: {max_depth}")
     logger.info(f"Max workers: {max_workers}")
-    logger.info(f"Baidu OCR: {'Enabled' if env_config['baidu_ocr_enabled'] else 'Disabled'}")
-    logger.info("")
-
-    # Step 1: PDF to images
-    logger.info("Step 1: Converting PDF to images...")
-    image_paths = pdf_to_images(pdf_path, str(images_dir))
-    logger.info(f"  Created {len(image_paths)} images")
-
-    # Get dimensions from first image
-    with Image.open(image_paths[0]) as img:
-        slide_width, slide_height = img.size
-    logger.info(f"  Slide dimensions: {slide_width}x{slide_height}")
+    logger.info(f"Render DPI: {dpi}")
+    logger.info(f"Baidu OCR: {'Enabled' if env_config.baidu_ocr_enabled else 'Disabled'}")
     logger.info("")
 
-    # Step 2: Initialize ImageEditabilityService
-    logger.info("Step 2: Initializing ImageEditabilityService...")
-    service = get_image_editability_service(
-        mineru_token=env_config['mineru_token'],
-        mineru_api_base=env_config['mineru_api_base'],
-        max_depth=max_depth,
-        upload_folder=upload_folder
-    )
-    logger.info(f"  Service initialized with max_depth={max_depth}")
-    logger.info("")
+    # Step 1: Start rendering, then initialize ImageEditabilityService while the
+    # render workers are busy (MinerU client, inpainting and Baidu OCR setup)
+    logger.info("Step 1: Converting PDF to images and initializing ImageEditabilityService...")
+    # The render pool is shut down on the way out even if service setup or
+    # analysis fails before every page has been consumed
+    with iter_pdf_images(pdf_path, str(images_dir), dpi=dpi) as rendered_pages:
+        service = get_image_editability_service(
+            mineru_token=env_config.mineru_token,
+            mineru_api_base=env_config.mineru_api_base,
+            max_depth=max_depth,
+            upload_folder=upload_folder
+        )
+        logger.info(f"  Service initialized with max_depth={max_depth}")
+        logger.info("")
+
+        # Step 2: Process each page as soon as it is saved, so MinerU uploads and
+        # inpainting for early pages overlap with rendering of later ones. Pages are
+        # handed to the PPTX builder in order as they finish, so slide composition
+        # overlaps with analysis of the remaining pages.
+        logger.info("Step 2: Processing images with recursive analysis and building the PPTX...")
+        logger.info("  This includes: MinerU parsing, element extraction, inpainting, and optional Baidu OCR")
+
+        # Page sizes come from the rendered pixmaps, so no image has to be re-opened
+        page_sizes = []
+
+        def stream_image_paths():
+            for img_path, page_size in rendered_pages:
+                page_sizes.append(page_size)
+                yield img_path
+
+        editable_images = []
+
+        def stream_editable_images():
+            for editable_img in service.iter_multi_images_editable(
+                stream_image_paths(), max_workers=max_workers
+            ):
+                editable_images.append(editable_img)
+                logger.info(
+                    f"  Page {len(editable_images)}: {len(editable_img.elements)} elements, "
+                    f"clean_background={'Yes' if editable_img.clean_background else 'No'}"
+                )
+                yield editable_img
+
+        # The slide size is taken from the first page, which is known once that page
+        # has been analyzed; the remaining pages keep streaming into the builder.
+        analyzed_pages = stream_editable_images()
+        first_page = next(analyzed_pages, None)
+        if first_page is None:
+            raise ValueError(f"No pages rendered from {pdf_path}")
+
+        slide_width, slide_height = page_sizes[0]
+        logger.info(f"  Slide dimensions: {slide_width}x{slide_height}")
+
+        ExportService.create_editable_pptx_with_recursive_analysis(
+            editable_images=itertools.chain((first_page,), analyzed_pages),
+            output_file=str(output_pptx),
+            slide_width_pixels=slide_width,
+            slide_height_pixels=slide_height
+        )
 
-    # Step 3: Process all images with recursive analysis
-    logger.info("Step 3: Processing images with recursive analysis...")
-    logger.info("  This includes: MinerU parsing, element extraction, inpainting, and optional Baidu OCR")
-    editable_images = service.make_multi_images_editable(
-        image_paths=image_paths,
-        parallel=True,
-        max_workers=max_workers
-    )
     logger.info(f"  Processed {len(editable_images)} pages")
-
-    # Log analysis summary
-    for i, editable_img in enumerate(editable_images):
-        elem_count = len(editable_img.elements)
-        has_clean_bg = bool(editable_img.clean_background)
-        logger.info(f"  Page {i+1}: {elem_count} elements, clean_background={'Yes' if has_clean_bg else 'No'}")
-    logger.info("")
-
-    # Step 4: Create editable PPTX
-    logger.info("Step 4: Creating editable PPTX with recursive elements...")
-    ExportService.create_editable_pptx_with_recursive_analysis(
-        editable_images=editable_images,
-        output_file=str(output_pptx),
-        slide_width_pixels=slide_width,
-        slide_height_pixels=slide_height
-    )
     logger.info(f"  PPTX saved to: {output_pptx}")
 
+    total_elements = total_with_clean_bg = 0
+    for editable_img in editable_images:
+        total_elements += len(editable_img.elements)
+        total_with_clean_bg += bool(editable_img.clean_background)
+
     # Summary
     logger.info("")
     logger.info("=" * 60)
     logger.info("Conversion complete!")
     logger.info("=" * 60)
     logger.info(f"Output: {output_pptx}")
-    logger.info(f"Images kept at: {images_dir}")
-
-    # Count total elements
-    total_elements = sum(len(img.elements) for img in editable_images)
-    total_with_clean_bg = sum(1 for img in editable_images if img.clean_background)
+    if keep_images:
+        logger.info(f"Images kept at: {images_dir}")
     logger.info(f"Total elements extracted: {total_elements}")
     logger.info(f"Pages with clean backgrounds: {total_with_clean_bg}/{len(editable_images)}")
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer (e.g. --dpi)"""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -255,6 +535,19 @@ if __name__ == "__main__":
         default=4,
         help="Number of parallel workers for image processing (default: 4)"
     )
+    parser.add_argument(
+        "--keep-images",
+        action="store_true",
+        help="Keep rendered page images in the output directory "
+             "(default: write them to a temporary directory, RAM-backed when /dev/shm has "
+             "room, otherwise under TMPDIR, and delete them)"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=_positive_int,
+        default=NATIVE_PDF_DPI,
+        help=f"Page rendering resolution in DPI (default: {NATIVE_PDF_DPI}, the PDF's native size)"
+    )
 
     args = parser.parse_args()
 
@@ -263,7 +556,9 @@ if __name__ == "__main__":
             args.input_file,
             output_dir=args.output_dir,
             max_depth=args.max_depth,
-            max_workers=args.max_workers
+            max_workers=args.max_workers,
+            dpi=args.dpi,
+            keep_images=args.keep_images
         )
     except Exception as e:
         logger.error(f"Conversion failed: {e}", exc_info=True)
@@ -7,7 +7,8 @@ import json
 import logging
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from collections.abc import Sized
+from typing import List, Dict, Any, Iterable, Optional
 from textwrap import dedent
 from pptx import Presentation
 from pptx.util import Inches
@@ -23,6 +24,9 @@ logger = logging.getLogger(__name__)
 class ExportService:
     """Service for exporting presentations"""
     
+    # Shared template style extractor, so its per-template cache survives across exports
+    _style_extractor = None
+    
     @staticmethod
     def generate_clean_background(original_image_path: str, ai_service, aspect_ratio: str = "16:9", resolution: str = "2K") -> Optional[str]:
         """
@@ -482,8 +486,9 @@ class ExportService:
         style_config = None
         if template_dir and Path(template_dir).exists():
             try:
-                extractor = TemplateStyleExtractor()
-                style_config = extractor.extract_styles(template_dir)
+                if ExportService._style_extractor is None:
+                    ExportService._style_extractor = TemplateStyleExtractor()
+                style_config = ExportService._style_extractor.extract_styles(template_dir)
                 logger.info(f"Loaded template styles from: {template_dir}")
                 logger.info(f"  Title font: {style_config.title_font.name}")
                 logger.info(f"  Body font: {style_config.body_font.name}")
@@ -831,7 +836,7 @@ class ExportService:
         mineru_api_base: str = None,
         max_depth: int = 2,
         max_workers: int = 4,
-        editable_images: List = None  # 可选：直接传入已分析的EditableImage列表
+        editable_images: Iterable = None  # 可选：直接传入已分析的EditableImage列表或按页序产出的可迭代对象
     ) -> bytes:
         """
         使用递归图片可编辑化服务创建可编辑PPTX
@@ -842,6 +847,9 @@ class ExportService:
         1. 传入 image_paths：自动分析图片并生成PPTX
         2. 传入 editable_images：直接使用已分析的结果（避免重复分析）
         
+        editable_images 可以是生成器：每到达一页就立即构建对应幻灯片，
+        使幻灯片构建与后续页面的分析重叠执行
+        
         Args:
             image_paths: 图片路径列表（可选，与editable_images二选一）
             output_file: 输出文件路径（可选）
@@ -851,7 +859,7 @@ class ExportService:
             mineru_api_base: MinerU API base
             max_depth: 最大递归深度
             max_workers: 并发处理数
-            editable_images: 已分析的EditableImage列表（可选，与image_paths二选一）
+            editable_images: 已分析的EditableImage列表或可迭代对象（可选，与image_paths二选一）
         
         Returns:
             PPTX文件字节流（如果output_file为None）
@@ -861,12 +869,18 @@ class ExportService:
         
         # 如果已提供分析结果，直接使用；否则需要分析
         if editable_images is not None:
-            logger.info(f"使用已提供的 {len(editable_images)} 个分析结果创建PPTX")
+            if isinstance(editable_images, Sized):
+                total_pages = len(editable_images)
+                logger.info(f"使用已提供的 {total_pages} 个分析结果创建PPTX")
+            else:
+                total_pages = '?'
+                logger.info("使用逐页到达的分析结果创建PPTX")
         else:
             if not image_paths:
                 raise ValueError("必须提供 image_paths 或 editable_images 之一")
             
-            logger.info(f"开始使用递归分析方法创建可编辑PPTX，共 {len(image_paths)} 页")
+            total_pages = len(image_paths)
+            logger.info(f"开始使用递归分析方法创建可编辑PPTX，共 {total_pages} 页")
             
             # 1. 获取ImageEditabilityService
             editability_service = get_image_editability_service(
@@ -877,9 +891,8 @@ class ExportService:
             
             # 2. 并发处理所有页面，生成EditableImage结构
             logger.info(f"Step 1: 分析 {len(image_paths)} 张图片（并发数: {max_workers}）...")
-            editable_images = editability_service.make_multi_images_editable(
+            editable_images = editability_service.iter_multi_images_editable(
                 image_paths=image_paths,
-                parallel=True,
                 max_workers=max_workers
             )
         
@@ -890,9 +903,9 @@ class ExportService:
         builder.create_presentation()
         builder.setup_presentation_size(slide_width_pixels, slide_height_pixels)
         
-        # 4. 为每个页面构建幻灯片
+        # 4. 为每个页面构建幻灯片（分析结果按页序到达即构建）
         for page_idx, editable_img in enumerate(editable_images):
-            logger.info(f"  构建第 {page_idx + 1}/{len(editable_images)} 页...")
+            logger.info(f"  构建第 {page_idx + 1}/{total_pages} 页...")
             
             # 创建空白幻灯片
             slide = builder.add_blank_slide()
@@ -76,6 +76,10 @@ class FileParserService:
         self.get_upload_url_api = f"{mineru_api_base}/api/v4/file-urls/batch"
         self.get_result_api_template = f"{mineru_api_base}/api/v4/extract-results/batch/{{}}"
         
+        # Shared HTTP session for MinerU calls: keeps TCP/TLS connections alive across
+        # the requests of one parse and across pages parsed concurrently by the same service
+        self._session = requests.Session()
+        
         # Store config for lazy initialization
         self._google_api_key = google_api_key
         self._google_api_base = google_api_base
@@ -288,7 +292,7 @@ class FileParserService:
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.get_upload_url_api,
                 headers=headers,
                 json=upload_data,
@@ -315,7 +319,7 @@ class FileParserService:
         """Upload file to MinerU"""
         try:
             with open(file_path, 'rb') as f:
-                response = requests.put(
+                response = self._session.put(
                     upload_url,
                     data=f,
                     headers={"Authorization": None},  # Remove auth for upload
@@ -354,7 +358,7 @@ class FileParserService:
                 return None, None, error_msg
             
             try:
-                response = requests.get(result_url, headers=headers, timeout=30)
+                response = self._session.get(result_url, headers=headers, timeout=30)
                 response.raise_for_status()
                 task_info = response.json()
                 
@@ -390,7 +394,7 @@ class FileParserService:
             Tuple of (markdown_content, extract_id, error_message)
         """
         try:
-            response = requests.get(zip_url, timeout=60)
+            response = self._session.get(zip_url, timeout=60)
             response.raise_for_status()
             
             # Generate unique directory name for this extraction
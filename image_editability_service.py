@@ -12,7 +12,8 @@ import json
 import logging
 import tempfile
 import uuid
-from typing import Dict, Any, List, Optional, Tuple
+from collections.abc import Sized
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from PIL import Image
 from dataclasses import dataclass, field, asdict
@@ -825,9 +826,9 @@ class ImageEditabilityService:
         查找缓存的MinerU结果
         
         逻辑：
-        1. 根据图片路径计算一个唯一的哈希值
-        2. 在 mineru_files 目录下查找包含该哈希值或图片名称相关的目录
-        3. 如果找不到，返回 None
+        1. 遍历 mineru_files 目录下包含 layout.json 的结果目录
+        2. 最近1小时内修改过的目录仅记录为可能的缓存（尚无精确匹配逻辑）
+        3. 目前总是返回 None，每次都重新解析
         
         Args:
             image_path: 图片路径
@@ -836,7 +837,6 @@ class ImageEditabilityService:
             如果找到缓存的结果目录，返回Path；否则返回None
         """
         try:
-            import hashlib
             import time
             
             # 获取图片文件信息
@@ -844,16 +844,13 @@ class ImageEditabilityService:
             if not img_path.exists():
                 return None
             
-            # 计算文件的MD5哈希（用于缓存键）
-            file_hash = hashlib.md5(img_path.read_bytes()).hexdigest()[:8]
-            
             # MinerU结果存储目录
             mineru_files_dir = self.upload_folder / 'mineru_files'
             if not mineru_files_dir.exists():
                 return None
             
             # 查找匹配的缓存目录
-            # 策略1: 查找包含文件哈希的目录
+            # 策略1: 查找最近修改过的MinerU结果目录
             for cache_dir in mineru_files_dir.iterdir():
                 if not cache_dir.is_dir():
                     continue
@@ -978,58 +975,92 @@ class ImageEditabilityService:
     
     def make_multi_images_editable(
         self,
-        image_paths: List[str],
+        image_paths: Iterable[str],
         parallel: bool = True,
         max_workers: int = 4
     ) -> List[EditableImage]:
         """
         批量处理多张图片（例如PPT的多页）
         
+        image_paths 可以是生成器：每产出一张图片就立即提交处理，
+        使上游的图片生成（如PDF渲染）与MinerU上传、inpainting 重叠执行
+        
         Args:
-            image_paths: 图片路径列表
+            image_paths: 图片路径列表或按页序产出路径的可迭代对象
             parallel: 是否并发处理
             max_workers: 最大并发数
         
         Returns:
-            EditableImage列表
+            EditableImage列表（与 image_paths 顺序一致）
         """
-        if not parallel or len(image_paths) == 1:
+        total = len(image_paths) if isinstance(image_paths, Sized) else '?'
+        
+        if not parallel or total == 1:
             # 串行处理
             results = []
             for idx, img_path in enumerate(image_paths):
-                logger.info(f"处理第 {idx + 1}/{len(image_paths)} 张图片...")
+                logger.info(f"处理第 {idx + 1}/{total} 张图片...")
                 editable = self.make_image_editable(img_path)
                 results.append(editable)
             return results
         
         # 并发处理
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        return list(self.iter_multi_images_editable(image_paths, max_workers=max_workers))
+    
+    def iter_multi_images_editable(
+        self,
+        image_paths: Iterable[str],
+        max_workers: int = 4
+    ) -> Iterator[EditableImage]:
+        """
+        并发处理多张图片，按输入顺序逐张产出结果
         
-        results = [None] * len(image_paths)
+        某页及其之前的所有页处理完成后立即产出该页，下游（如逐页构建PPTX）
+        无需等待全部页面分析完成即可开始
+        
+        Args:
+            image_paths: 图片路径列表或按页序产出路径的可迭代对象
+            max_workers: 最大并发数
+        
+        Yields:
+            EditableImage（与 image_paths 顺序一致，处理失败的页面为空结果）
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # 生成器输入的总数未知，全程显示为 "?"
+        total = len(image_paths) if isinstance(image_paths, Sized) else '?'
+        submitted = []  # (img_path, future)，按输入顺序
+        next_idx = 0
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(self.make_image_editable, img_path): idx
-                for idx, img_path in enumerate(image_paths)
-            }
+            # 边产出边提交：前面的图片在后续图片生成期间就已开始处理
+            for img_path in image_paths:
+                submitted.append((img_path, executor.submit(self.make_image_editable, img_path)))
+                # 顺带产出已按序完成的结果
+                while next_idx < len(submitted) and submitted[next_idx][1].done():
+                    yield self._collect_editable_result(next_idx, total, *submitted[next_idx])
+                    next_idx += 1
             
-            for future in as_completed(future_to_index):
-                idx = future_to_index[future]
-                try:
-                    results[idx] = future.result()
-                    logger.info(f"✓ 第 {idx + 1}/{len(image_paths)} 张图片处理完成")
-                except Exception as e:
-                    logger.error(f"✗ 第 {idx + 1}/{len(image_paths)} 张图片处理失败: {e}")
-                    # 创建空的结果
-                    results[idx] = EditableImage(
-                        image_id=f"error_{idx}",
-                        image_path=image_paths[idx],
-                        width=0,
-                        height=0,
-                        metadata={'error': str(e)}
-                    )
-        
-        return results
+            for idx in range(next_idx, len(submitted)):
+                yield self._collect_editable_result(idx, total, *submitted[idx])
+    
+    @staticmethod
+    def _collect_editable_result(idx: int, total, img_path: str, future) -> EditableImage:
+        """等待单张图片的处理结果，失败时返回空的EditableImage"""
+        try:
+            result = future.result()
+            logger.info(f"✓ 第 {idx + 1}/{total} 张图片处理完成")
+            return result
+        except Exception as e:
+            logger.error(f"✗ 第 {idx + 1}/{total} 张图片处理失败: {e}")
+            # 创建空的结果
+            return EditableImage(
+                image_id=f"error_{idx}",
+                image_path=img_path,
+                width=0,
+                height=0,
+                metadata={'error': str(e)}
+            )
 
 
 # 便捷函数
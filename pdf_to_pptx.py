@@ -25,18 +25,30 @@ Template Support:
 
 import os
 import sys
+import atexit
+import shutil
 import logging
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+# Resolve script-relative paths once at import time
+_SCRIPT_DIR = Path(__file__).resolve().parent
+# Match the path calculation used by file_parser_service.py: two levels above this script
+_PROJECT_ROOT = _SCRIPT_DIR.parent.parent
+_DEFAULT_UPLOAD_ROOT = _PROJECT_ROOT / 'uploads'
 
 # Add the current directory to the path for imports
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(_SCRIPT_DIR))
 
 # Load environment variables from .env
 from dotenv import load_dotenv
-load_dotenv(script_dir / '.env')
+load_dotenv(_SCRIPT_DIR / '.env')
 
 # Setup logging
 logging.basicConfig(
@@ -46,35 +58,219 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def pdf_to_images(pdf_path: str, output_dir: str) -> List[str]:
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Environment settings, read once after .env has been loaded"""
+    mineru_token: Optional[str]
+    mineru_api_base: str
+    upload_folder: Optional[str]
+    volcengine_access_key: Optional[str]
+    volcengine_secret_key: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> 'EnvConfig':
+        return cls(
+            mineru_token=os.getenv('MINERU_TOKEN'),
+            mineru_api_base=os.getenv('MINERU_API_BASE', 'https://mineru.net'),
+            upload_folder=os.getenv('UPLOAD_FOLDER'),
+            volcengine_access_key=os.getenv('VOLCENGINE_ACCESS_KEY'),
+            volcengine_secret_key=os.getenv('VOLCENGINE_SECRET_KEY'),
+        )
+
+
+ENV = EnvConfig.from_env()
+
+
+# Rendering is CPU-bound and PyMuPDF holds the GIL, so pages are rendered in
+# worker processes; beyond ~6 workers the speedup flattens out.
+MAX_RENDER_WORKERS = 6
+
+# Emit a rendering progress line every N pages instead of one per page
+RENDER_PROGRESS_INTERVAL = 10
+
+# PDF user space is 72 units per inch, so rendering at 72 DPI keeps the native page size
+NATIVE_PDF_DPI = 72
+
+
+# Render state owned by each worker process (see _init_render_worker)
+_worker_doc = None
+_worker_colorspace = None
+_worker_matrix = None
+
+
+def _init_render_worker(pdf_path: str, dpi: int) -> None:
+    """
+    Open the PDF once per worker process instead of once per page
+
+    MuPDF contexts are not safe to share across threads, so each process keeps
+    its own independent document handle for the lifetime of the pool.
+    """
+    import fitz  # PyMuPDF
+
+    global _worker_doc, _worker_colorspace, _worker_matrix
+    _worker_doc = fitz.open(pdf_path)
+    _worker_colorspace = fitz.csRGB
+    zoom = dpi / NATIVE_PDF_DPI
+    _worker_matrix = fitz.Matrix(zoom, zoom)
+
+
+def _render_page(task: Tuple[int, str]) -> Tuple[str, Tuple[int, int]]:
+    """
+    Render a single PDF page to PNG (runs in a worker process)
+
+    Args:
+        task: (page_index, img_path)
+
+    Returns:
+        (image_path, (width, height)) of the generated image
+    """
+    from PIL import Image
+
+    page_index, img_path = task
+    # Explicit RGB without alpha: 3 bytes/pixel, matching the "RGB" frombytes below
+    pix = _worker_doc[page_index].get_pixmap(
+        matrix=_worker_matrix, colorspace=_worker_colorspace, alpha=False
+    )
+
+    # Encode via Pillow with fast deflate: pix.save() uses libpng's default
+    # compression, which dominates render time and buys nothing downstream.
+    Image.frombytes("RGB", (pix.width, pix.height), pix.samples).save(
+        img_path, "PNG", compress_level=1
+    )
+    return img_path, (pix.width, pix.height)
+
+
+def pdf_to_images(
+    pdf_path: str,
+    output_dir: str,
+    max_workers: int = MAX_RENDER_WORKERS,
+    dpi: int = NATIVE_PDF_DPI
+) -> Tuple[List[str], Tuple[int, int]]:
     """
     Convert PDF to images using PyMuPDF
 
+    Pages are rendered in parallel by a process pool; the returned paths keep page order.
+
     Args:
         pdf_path: Path to input PDF file
         output_dir: Directory to save output images
+        max_workers: Upper bound on rendering processes (default: 6)
+        dpi: Rendering resolution (default: 72, the PDF's native page size)
 
     Returns:
-        List of paths to generated images
+        (image_paths, (width, height)) - generated image paths and the pixel size of the first page
     """
     import fitz  # PyMuPDF
+    from concurrent.futures import ProcessPoolExecutor
 
     os.makedirs(output_dir, exist_ok=True)
-    doc = fitz.open(pdf_path)
-    image_paths = []
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+
+    logger.info(f"  PDF has {page_count} pages")
+
+    # Join the directory once; per-page paths are plain string concatenation
+    path_prefix = os.fspath(output_dir).rstrip(os.sep) + os.sep
+    tasks = [(i, f"{path_prefix}page_{i:03d}.png") for i in range(page_count)]
+    num_workers = max(1, min(os.cpu_count() or 1, max_workers, page_count))
+
+    image_paths = [None] * page_count
+    first_page_size = None
+    # Spawned (not forked) workers: main() may be importing modules on the
+    # MinerU thread at this point, and a forked child would inherit that
+    # thread's import locks with no owner left to release them.
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_worker,
+        initargs=(pdf_path, dpi)
+    ) as executor:
+        for i, (img_path, page_size) in enumerate(executor.map(_render_page, tasks)):
+            if first_page_size is None:
+                first_page_size = page_size
+            image_paths[i] = img_path
+            if (i + 1) % RENDER_PROGRESS_INTERVAL == 0 or i + 1 == page_count:
+                logger.info(f"  Saved {i+1}/{page_count} pages to {output_dir}")
+
+    return image_paths, first_page_size
+
+
+# RAM-backed scratch space (Linux tmpfs) for page images that are not kept
+_RAM_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+# Images written to the scratch directory per page (page PNG, inpainting mask and clean background)
+SCRATCH_IMAGES_PER_PAGE = 3
+
+
+def _estimate_scratch_bytes(pdf_path: str, dpi: int) -> int:
+    """
+    Rough upper bound on scratch space: every image as raw RGB at the first page's size
+    """
+    import fitz  # PyMuPDF
 
-    logger.info(f"  PDF has {len(doc)} pages")
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+        if not page_count:
+            return 0
+        rect = doc[0].rect
+    zoom = dpi / NATIVE_PDF_DPI
+    page_bytes = int(rect.width * zoom) * int(rect.height * zoom) * 3
+    return page_bytes * page_count * SCRATCH_IMAGES_PER_PAGE
 
-    for i, page in enumerate(doc):
-        # Render at native PDF size to preserve original page dimensions
-        pix = page.get_pixmap()
-        img_path = os.path.join(output_dir, f"page_{i:03d}.png")
-        pix.save(img_path)
-        image_paths.append(img_path)
-        logger.info(f"  Saved page {i+1}/{len(doc)}: {img_path}")
 
-    doc.close()
-    return image_paths
+def make_scratch_images_dir(prefix: str, pdf_path: str, dpi: int) -> Path:
+    """
+    Create a temporary directory for page images, on tmpfs when it has room
+
+    Rendered pages are only read back by later pipeline steps, so keeping them in
+    RAM avoids a write-then-read round trip through the disk. tmpfs is often small
+    (64 MB by default in Docker), so when the estimated output does not fit, the
+    directory goes to the regular temp dir (TMPDIR) instead. The directory is
+    removed when the process exits, including on failure.
+
+    Args:
+        prefix: Name prefix for the directory (typically the input PDF name)
+        pdf_path: PDF that will be rendered into the directory
+        dpi: Rendering resolution
+
+    Returns:
+        Path to the new directory
+    """
+    scratch_root = _RAM_TMP_DIR
+    if scratch_root is not None:
+        needed = _estimate_scratch_bytes(pdf_path, dpi)
+        free = shutil.disk_usage(scratch_root).free
+        if needed > free:
+            logger.info(
+                f"  {scratch_root} has {free >> 20} MB free but ~{needed >> 20} MB may be needed; "
+                f"using {tempfile.gettempdir()} for page images"
+            )
+            scratch_root = None
+
+    images_dir = Path(tempfile.mkdtemp(prefix=f"{prefix}_images_", dir=scratch_root))
+    atexit.register(shutil.rmtree, images_dir, ignore_errors=True)
+    return images_dir
+
+
+def run_in_background(fn, *args) -> Future:
+    """
+    Run fn(*args) on a daemon thread and return a Future for its result
+
+    Unlike a ThreadPoolExecutor worker, the daemon thread does not hold up
+    interpreter exit, so an abandoned call (e.g. after a failed Step 1) does
+    not keep the CLI alive until it finishes.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"bg-{fn.__name__}", daemon=True).start()
+    return future
 
 
 def parse_pdf_with_mineru(pdf_path: str, filename: str) -> str:
@@ -91,17 +287,13 @@ def parse_pdf_with_mineru(pdf_path: str, filename: str) -> str:
     from file_parser_service import FileParserService
     from utils.self_hosted_mineru import is_self_hosted_mineru, parse_pdf_via_self_hosted_mineru
 
-    mineru_token = os.getenv('MINERU_TOKEN')
-    mineru_api_base = os.getenv('MINERU_API_BASE', 'https://mineru.net')
+    mineru_token = ENV.mineru_token
+    mineru_api_base = ENV.mineru_api_base
 
     # Self-hosted MinerU (/file_parse) does not use the cloud token flow.
     if is_self_hosted_mineru(mineru_api_base):
-        upload_folder = os.getenv('UPLOAD_FOLDER')
-        if upload_folder:
-            upload_root = Path(upload_folder)
-        else:
-            # Match the default used later in this script (and FileParserService): ~/uploads
-            upload_root = Path(__file__).resolve().parent.parent.parent / "uploads"
+        # Same default as used later in this script (and FileParserService)
+        upload_root = Path(ENV.upload_folder) if ENV.upload_folder else _DEFAULT_UPLOAD_ROOT
 
         extract_id, _extract_dir = parse_pdf_via_self_hosted_mineru(
             Path(pdf_path),
@@ -150,9 +342,7 @@ def generate_clean_backgrounds(image_paths: List[str], mineru_result_dir: str) -
     from export_service_inpainting import InpaintingExportHelper
 
     # Check if VolcEngine credentials are configured
-    volcengine_access_key = os.getenv('VOLCENGINE_ACCESS_KEY')
-    volcengine_secret_key = os.getenv('VOLCENGINE_SECRET_KEY')
-    use_inpainting = bool(volcengine_access_key and volcengine_secret_key)
+    use_inpainting = bool(ENV.volcengine_access_key and ENV.volcengine_secret_key)
 
     if not use_inpainting:
         logger.warning("  VolcEngine credentials not configured, using original images as backgrounds")
@@ -203,7 +393,14 @@ def create_editable_pptx(
     )
 
 
-def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru_results_dir: str = None):
+def main(
+    pdf_path: str,
+    output_dir: str = None,
+    template_dir: str = None,
+    mineru_results_dir: str = None,
+    dpi: int = NATIVE_PDF_DPI,
+    keep_images: bool = False
+):
     """
     Main conversion pipeline
 
@@ -211,9 +408,10 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
         pdf_path: Path to input PDF file
         output_dir: Output directory (default: ./output_files)
         template_dir: Template directory (default: ./templates)
+        mineru_results_dir: Existing MinerU result directory to reuse instead of parsing
+        dpi: Page rendering resolution (default: 72, the PDF's native page size)
+        keep_images: Keep page images in the run directory instead of a temporary directory
     """
-    from PIL import Image
-
     # Validate input file exists
     if not os.path.exists(pdf_path):
         logger.error(f"Input file not found: {pdf_path}")
@@ -221,7 +419,7 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
 
     # Setup output directories
     if output_dir is None:
-        output_dir = script_dir / "output_files"
+        output_dir = _SCRIPT_DIR / "output_files"
     else:
         output_dir = Path(output_dir)
     base_output_dir = Path(output_dir)
@@ -231,12 +429,16 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
     pdf_name = Path(pdf_path).stem
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     run_dir = base_output_dir / f"{pdf_name}_{timestamp}"
-    images_dir = run_dir / "images"
-    os.makedirs(images_dir, exist_ok=True)
+    os.makedirs(run_dir, exist_ok=True)
+    if keep_images:
+        images_dir = run_dir / "images"
+        os.makedirs(images_dir, exist_ok=True)
+    else:
+        images_dir = make_scratch_images_dir(pdf_name, pdf_path, dpi)
 
     # Setup template directory (default to ./templates)
     if template_dir is None:
-        default_template_dir = script_dir / "templates"
+        default_template_dir = _SCRIPT_DIR / "templates"
         if default_template_dir.exists():
             template_dir = str(default_template_dir)
             logger.info(f"Using default template directory: {template_dir}")
@@ -252,16 +454,25 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
     logger.info(f"Input: {pdf_path}")
     logger.info(f"Output directory: {base_output_dir}")
     logger.info(f"Run output directory: {run_dir}")
+    logger.info(f"Render DPI: {dpi}")
     logger.info("")
 
-    # Step 1: PDF to images (kept in output_files/images/)
+    # MinerU parses the PDF itself rather than the rendered pages, so start the
+    # upload now and let its network round trips overlap with Step 1 rendering.
+    mineru_future = None
+    if not mineru_results_dir:
+        mineru_future = run_in_background(parse_pdf_with_mineru, pdf_path, os.path.basename(pdf_path))
+
+    # Step 1: PDF to images (kept in <run_dir>/images/ only with --keep-images)
     logger.info("Step 1: Converting PDF to images...")
-    image_paths = pdf_to_images(pdf_path, str(images_dir))
+    try:
+        image_paths, (slide_width, slide_height) = pdf_to_images(pdf_path, str(images_dir), dpi=dpi)
+    except BaseException:
+        if mineru_future is not None:
+            # Drop the MinerU call; its daemon thread does not delay exit
+            mineru_future.cancel()
+        raise
     logger.info(f"  Created {len(image_paths)} images")
-
-    # Get dimensions from first image
-    with Image.open(image_paths[0]) as img:
-        slide_width, slide_height = img.size
     logger.info(f"  Slide dimensions: {slide_width}x{slide_height}")
     logger.info("")
 
@@ -284,20 +495,15 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
         mineru_result_dir = str(mineru_dir)
         logger.info("")
     else:
-        logger.info("Step 2: Parsing PDF with MinerU...")
-        extract_id = parse_pdf_with_mineru(pdf_path, os.path.basename(pdf_path))
+        logger.info("Step 2: Parsing PDF with MinerU (started alongside Step 1)...")
+        extract_id = mineru_future.result()
 
         # Determine MinerU result directory
         # If UPLOAD_FOLDER is set, match FileParserService extraction location.
         # Otherwise fall back to FileParserService's legacy path calculation:
         #   current_file.parent.parent.parent / 'uploads' / 'mineru_files'
         # For /Users/bill/workspace/banana-slides-services, this becomes /Users/bill/uploads
-        upload_folder = os.getenv('UPLOAD_FOLDER')
-        if not upload_folder:
-            # Match the path calculation in file_parser_service.py
-            # It goes: file_parser_service.py -> parent.parent (workspace) -> parent (bill) -> uploads
-            project_root = script_dir.parent.parent  # Goes up 2 levels from script_dir
-            upload_folder = str(project_root / 'uploads')
+        upload_folder = ENV.upload_folder or str(_DEFAULT_UPLOAD_ROOT)
 
         mineru_result_dir = os.path.join(upload_folder, 'mineru_files', extract_id)
         logger.info(f"  MinerU results: {mineru_result_dir}")
@@ -327,10 +533,24 @@ def main(pdf_path: str, output_dir: str = None, template_dir: str = None, mineru
     logger.info("Conversion complete!")
     logger.info("=" * 60)
     logger.info(f"Output: {output_pptx}")
-    logger.info(f"Images kept at: {images_dir}")
+    if keep_images:
+        logger.info(f"Images kept at: {images_dir}")
     logger.info(f"MinerU results at: {mineru_result_dir}")
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer (e.g. --dpi)"""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -359,11 +579,31 @@ if __name__ == "__main__":
         help="Template directory containing title-slide.pptx and non-title-slide.pptx "
              "(default: ./templates)"
     )
+    parser.add_argument(
+        "--keep-images",
+        action="store_true",
+        help="Keep rendered page images in the output directory "
+             "(default: write them to a temporary directory, RAM-backed when /dev/shm has "
+             "room, otherwise under TMPDIR, and delete them)"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=_positive_int,
+        default=NATIVE_PDF_DPI,
+        help=f"Page rendering resolution in DPI (default: {NATIVE_PDF_DPI}, the PDF's native size)"
+    )
 
     args = parser.parse_args()
 
     try:
-        main(args.input_file, output_dir=args.output_dir, template_dir=args.template_dir, mineru_results_dir=args.mineru_results_dir)
+        main(
+            args.input_file,
+            output_dir=args.output_dir,
+            template_dir=args.template_dir,
+            mineru_results_dir=args.mineru_results_dir,
+            dpi=args.dpi,
+            keep_images=args.keep_images
+        )
     except Exception as e:
         logger.error(f"Conversion failed: {e}", exc_info=True)
         sys.exit(1)
@@ -202,25 +202,27 @@ def visualize_mask_overlay(
         else:
             original_rgba = original_image.copy()
         
+        # 白色（或接近白色，即各通道均值 > 200）区域设为红色半透明。
+        # L / RGB 掩码用查找表在 C 层完成逐像素判断，避免 Python 双重循环逐像素读写
+        overlay_alpha = int(128 * alpha)
+        if mask_image.mode == 'L':
+            alpha_channel = mask_image.point(lambda v: overlay_alpha if v > 200 else 0)
+        elif mask_image.mode == 'RGB':
+            # 均值 > 200 等价于三通道之和 >= 601。矩阵转换按 floor(x + 0.5) 取整，
+            # 偏移 0.25 使 sum/3 + 0.25 取整后 > 200 当且仅当 sum >= 601（已对全部 RGB 组合验证）
+            brightness = mask_image.convert('L', matrix=(1 / 3, 1 / 3, 1 / 3, 0.25))
+            alpha_channel = brightness.point(lambda v: overlay_alpha if v > 200 else 0)
+        else:
+            # 其他模式（如 RGBA 的均值包含 alpha 通道）较少见，按原语义逐像素计算
+            alpha_channel = Image.new('L', mask_image.size)
+            alpha_channel.putdata([
+                overlay_alpha if (sum(p) / len(p) if isinstance(p, tuple) else p) > 200 else 0
+                for p in mask_image.getdata()
+            ])
+        
         # 创建红色半透明掩码用于可视化
         mask_rgba = Image.new('RGBA', original_image.size, (255, 0, 0, 0))
-        draw = ImageDraw.Draw(mask_rgba)
-        
-        # 遍历掩码图像，将白色区域绘制为红色半透明
-        mask_array = mask_image.load()
-        mask_rgba_array = mask_rgba.load()
-        
-        for y in range(mask_image.size[1]):
-            for x in range(mask_image.size[0]):
-                pixel = mask_array[x, y]
-                # 如果是白色（或接近白色），设置为红色半透明
-                if isinstance(pixel, tuple):
-                    brightness = sum(pixel) / len(pixel)
-                else:
-                    brightness = pixel
-                
-                if brightness > 200:  # 接近白色
-                    mask_rgba_array[x, y] = (255, 0, 0, int(128 * alpha))
+        mask_rgba.putalpha(alpha_channel)
         
         # 叠加
         result = Image.alpha_composite(original_rgba, mask_rgba)
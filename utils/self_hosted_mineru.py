@@ -15,20 +15,58 @@ into the same layout that the cloud MinerU flow produces:
 
 from __future__ import annotations
 
-import datetime as _dt
+import functools
+import json
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
 import uuid
 import zipfile
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple, Union
+
+import requests
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # safety net only; requests-toolbelt is a declared requirement
+    MultipartEncoder = None
+
+try:
+    import orjson
+except ImportError:  # safety net only; without it layout.json is linked unvalidated
+    orjson = None
 
 
 DEFAULT_SELF_HOSTED_ENDPOINT = "http://ai23.labs.hpecorp.net:8023/file_parse"
 
+# Hosts matching this are treated as self-hosted MinerU (/file_parse)
+_SELF_HOSTED_RE = re.compile(r"hpecorp", re.IGNORECASE)
+
+# Chunk size used when streaming the ZIP response
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Buffer size used when copying each ZIP member to disk
+_EXTRACT_BUFFER_SIZE = 1 << 20
+# Middle json files up to this size are parsed once to catch truncated payloads
+_VALIDATE_JSON_MAX_SIZE = 64 << 20
+# Upper bound on threads used to extract ZIP members
+_MAX_EXTRACT_WORKERS = 8
+# Bytes of an error response body kept in the raised exception
+_ERROR_SNIPPET_SIZE = 10_000
+# ZIP responses up to this size are spooled in memory rather than to a temp file
+_SPOOL_MAX_SIZE = 64 << 20
+
+# Shared session so back-to-back parses reuse the connection to the MinerU server
+_SESSION = requests.Session()
+
 
 def is_self_hosted_mineru(mineru_api_base: str) -> bool:
-    return "hpecorp" in (mineru_api_base or "").lower()
+    return bool(_SELF_HOSTED_RE.search(mineru_api_base or ""))
 
 
 def resolve_self_hosted_endpoint(mineru_api_base_or_endpoint: str) -> str:
@@ -47,138 +85,356 @@ def resolve_self_hosted_endpoint(mineru_api_base_or_endpoint: str) -> str:
     return url.rstrip("/") + "/file_parse"
 
 
+@functools.lru_cache(maxsize=None)
+def _resolved_abs(p: str) -> Path:
+    return Path(p).resolve()
+
+
+def _resolved(p: str) -> Path:
+    # Only absolute paths are cached: a relative one depends on the current
+    # working directory, which may change between calls.
+    return _resolved_abs(os.path.abspath(os.path.expanduser(p)))
+
+
+# mineru_files directories already created by this process
+_created_mineru_dirs: Set[Path] = set()
+
+
+def _mineru_files_dir(upload_folder: Path) -> Path:
+    """
+    Return <upload_folder>/mineru_files, resolving and creating it only on
+    first use so repeated parses into the same folder skip both steps.
+    """
+    mineru_dir = _resolved(str(upload_folder)) / "mineru_files"
+    if mineru_dir not in _created_mineru_dirs:
+        mineru_dir.mkdir(parents=True, exist_ok=True)
+        _created_mineru_dirs.add(mineru_dir)
+    return mineru_dir
+
+
+class _ZipSpool(tempfile.SpooledTemporaryFile):
+    """
+    SpooledTemporaryFile usable as a ZipFile source on every supported Python.
+
+    Before 3.11 it lacks `seekable()`, which `ZipFile.open()` requires; both of
+    its backing stores (BytesIO and a temp file) are always seekable.
+    """
+
+    def seekable(self) -> bool:
+        return True
+
+
 def _timestamp() -> str:
-    return _dt.datetime.now().strftime("%Y%m%d-%H%M%S")
+    return time.strftime("%Y%m%d-%H%M%S")
 
 
-def _safe_extractall(zf: zipfile.ZipFile, out_dir: Path) -> None:
+def _validate_paths(zf: zipfile.ZipFile, out_dir: Path) -> List[Tuple[zipfile.ZipInfo, str]]:
     """
     Prevent Zip Slip by ensuring every extracted path stays within out_dir.
+
+    The check is purely lexical (no filesystem access per member): absolute
+    names and `..` components are rejected outright, and the normalized
+    destination must stay under the resolved output directory. Returns
+    (member, destination path) pairs.
     """
-    out_dir_resolved = out_dir.resolve()
+    root = str(out_dir.resolve())
+    root_prefix = root + os.sep
+    targets = []
     for member in zf.infolist():
-        dest = (out_dir_resolved / member.filename).resolve()
-        if not str(dest).startswith(str(out_dir_resolved) + os.sep) and dest != out_dir_resolved:
-            raise RuntimeError(f"Unsafe path in zip: {member.filename}")
-    zf.extractall(out_dir_resolved)
+        name = member.filename
+        parts = name.replace("\\", "/").split("/")
+        if name.startswith(("/", "\\")) or os.path.isabs(name) or ".." in parts:
+            raise RuntimeError(f"Unsafe path in zip: {name}")
+        dest = os.path.normpath(os.path.join(root, name))
+        if dest != root and not dest.startswith(root_prefix):
+            raise RuntimeError(f"Unsafe path in zip: {name}")
+        targets.append((member, dest))
+    return targets
+
+
+def _extract_member(
+    zf: zipfile.ZipFile, member: zipfile.ZipInfo, dest: str, open_lock: threading.Lock
+) -> None:
+    # ZipFile lets several members be read at once, but opening and closing a
+    # member updates shared bookkeeping, so those two steps are serialized.
+    with open_lock:
+        src = zf.open(member)
+    try:
+        with open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, _EXTRACT_BUFFER_SIZE)
+    finally:
+        with open_lock:
+            src.close()
 
 
-def _flatten_single_top_level_dir(extract_dir: Path) -> None:
+def _extract_parallel(zf: zipfile.ZipFile, targets: List[Tuple[zipfile.ZipInfo, str]]) -> None:
+    """
+    Stream validated members to disk through a fixed-size buffer, several at
+    a time. zlib releases the GIL while inflating, so members decompress in
+    parallel. Directories are created up front so workers never race on mkdir.
+    """
+    dirs = set()
+    files = []
+    for member, dest in targets:
+        if member.is_dir():
+            dirs.add(dest)
+        else:
+            dirs.add(os.path.dirname(dest))
+            files.append((member, dest))
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+
+    open_lock = threading.Lock()
+    max_workers = min(_MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_extract_member, zf, member, dest, open_lock)
+            for member, dest in files
+        ]
+        for future in futures:
+            future.result()
+
+
+def _safe_extractall(zf: zipfile.ZipFile, out_dir: Path) -> None:
+    """
+    Validate every member path (see `_validate_paths`), then extract the
+    archive into out_dir.
+    """
+    _extract_parallel(zf, _validate_paths(zf, out_dir))
+
+
+def _scan_once(path: Path) -> List[os.DirEntry]:
+    """
+    List a directory with a single `os.scandir()` pass.
+
+    The returned entries answer `name`/`is_dir()`/`is_file()` from the readdir
+    data, so helpers can share one listing instead of re-globbing.
+    """
+    with os.scandir(path) as it:
+        return list(it)
+
+
+def _flatten_single_top_level_dir(extract_dir: Path, entries: List[os.DirEntry]) -> bool:
     """
     If the zip extracted into a single top-level directory (common pattern),
     move its contents up one level so expected files live directly under extract_dir.
+
+    `entries` is the current listing of extract_dir. Returns True when entries
+    were moved, in which case the caller's listing is stale.
     """
     # Ignore artifacts we may have created (saved zip) and common zip metadata dirs.
     # In our flow, extract_dir usually contains:
-    #   - <something>.zip (saved response)
+    #   - <something>.zip (saved response, only with MINERU_KEEP_ZIP=1)
     #   - <top_level_dir>/... (actual extracted content)
     ignored_names = {"__MACOSX", ".DS_Store"}
     candidates = []
-    for p in extract_dir.iterdir():
-        if p.name in ignored_names:
+    for entry in entries:
+        if entry.name in ignored_names:
             continue
-        if p.is_file() and p.suffix.lower() == ".zip":
+        if entry.is_file() and entry.name.lower().endswith(".zip"):
             continue
-        candidates.append(p)
+        candidates.append(entry)
 
     if len(candidates) != 1:
-        return
+        return False
 
     only = candidates[0]
-    if not only.is_dir():
-        return
+    if not only.is_dir(follow_symlinks=False):
+        return False
 
     # Move every entry in <extract_dir>/<only>/ up to <extract_dir>/
-    for p in only.iterdir():
-        target = extract_dir / p.name
+    for entry in _scan_once(Path(only.path)):
+        target = extract_dir / entry.name
         if target.exists():
             raise RuntimeError(f"Cannot flatten zip output; target already exists: {target}")
-        p.rename(target)
+        os.rename(entry.path, target)
     # Remove the now-empty directory (best-effort)
     try:
-        only.rmdir()
+        os.rmdir(only.path)
     except OSError:
         pass
+    return True
 
 
-def _ensure_layout_json_from_middle_json(*, extract_dir: Path, pdf_stem: str) -> None:
+def _listing_preview(root: Path, limit: int = 200) -> str:
+    """
+    Return up to `limit` sorted paths under root (relative, POSIX-style),
+    collected with a single `os.walk` pass.
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        prefix = "" if rel == os.curdir else rel.replace(os.sep, "/") + "/"
+        entries.extend(prefix + name for name in dirnames)
+        entries.extend(prefix + name for name in filenames)
+    entries.sort()
+    preview = "\n".join(entries[:limit])
+    if len(entries) > limit:
+        preview += "\n... (truncated) ..."
+    return preview
+
+
+def _check_json(path: Path) -> None:
+    """
+    Raise RuntimeError if `path` is not JSON that downstream code can load.
+
+    Downstream readers use the stdlib `json` module, which accepts input that
+    orjson rejects (NaN, lone surrogates), so orjson only serves as the fast
+    path and the stdlib parser has the final say.
+    """
+    data = path.read_bytes()
+    try:
+        orjson.loads(data)
+    except orjson.JSONDecodeError:
+        try:
+            json.loads(data)
+        except ValueError as e:
+            raise RuntimeError(f"Self-hosted MinerU returned invalid JSON in {path}: {e}") from e
+
+
+def _ensure_layout_json_from_middle_json(
+    *, extract_dir: Path, pdf_stem: str, entries: List[os.DirEntry]
+) -> None:
     """
     Self-hosted MinerU may emit `<name>_middle.json` instead of `layout.json`.
-    To keep downstream code unchanged, materialize `layout.json` by copying
-    the appropriate `*_middle.json` when `layout.json` is missing.
+    To keep downstream code unchanged, materialize `layout.json` from the
+    appropriate `*_middle.json` when `layout.json` is missing.
+
+    `entries` is the current listing of extract_dir.
     """
-    layout_path = extract_dir / "layout.json"
-    if layout_path.exists():
+    names = {entry.name for entry in entries}
+    if "layout.json" in names:
         return
+    layout_path = extract_dir / "layout.json"
 
-    preferred = extract_dir / f"{pdf_stem}_middle.json"
-    middle_candidates = list(extract_dir.glob("*_middle.json"))
+    preferred_name = f"{pdf_stem}_middle.json"
+    middle_candidates = [entry for entry in entries if entry.name.endswith("_middle.json")]
 
     chosen: Optional[Path] = None
-    if preferred.exists():
-        chosen = preferred
+    if preferred_name in names:
+        chosen = extract_dir / preferred_name
     elif len(middle_candidates) == 1:
-        chosen = middle_candidates[0]
+        chosen = Path(middle_candidates[0].path)
 
     if chosen is None:
         if not middle_candidates:
             return  # nothing we can do; caller may choose to proceed without layout.json
-        candidates = "\n".join(sorted([p.name for p in middle_candidates]))
+        candidates = "\n".join(sorted([entry.name for entry in middle_candidates]))
         raise RuntimeError(
             "Multiple *_middle.json files found but layout.json is missing. "
             f"Cannot choose which to copy in {extract_dir}.\nCandidates:\n{candidates}"
         )
 
-    layout_path.write_bytes(chosen.read_bytes())
+    # With orjson available, parse the middle json here so a truncated payload
+    # fails at extraction time rather than in the export
+    if orjson is not None and chosen.stat().st_size <= _VALIDATE_JSON_MAX_SIZE:
+        _check_json(chosen)
+
+    # The middle json is never modified afterwards, so a hard link is enough;
+    # fall back to a kernel-side copy if linking is not possible.
+    try:
+        os.link(chosen, layout_path)
+    except OSError:
+        shutil.copyfile(chosen, layout_path)
 
 
 def _post_file_parse(
     *,
     endpoint: str,
-    pdf_path: Path,
+    pdf_source: Union[Path, BinaryIO],
+    pdf_name: str,
     form_fields: Dict[str, str],
     timeout_s: int,
-) -> bytes:
-    import requests  # requests is already used elsewhere in this repo
+) -> requests.Response:
+    """
+    POST the PDF to `/file_parse` and return the streamed `requests.Response`.
 
-    with pdf_path.open("rb") as f:
-        files = {"files": (pdf_path.name, f, "application/pdf")}
-        resp = requests.post(endpoint, data=form_fields, files=files, timeout=timeout_s)
+    `pdf_source` is either a path (opened here) or an already-open binary
+    stream, which is read as-is and left open for the caller to close.
+
+    The caller is responsible for consuming and closing the response. The
+    multipart body is streamed from the PDF in chunks with `requests_toolbelt`;
+    should it be missing, `requests` builds the whole body in memory instead.
+    """
+    pdf_cm = nullcontext(pdf_source) if hasattr(pdf_source, "read") else pdf_source.open("rb")
+    with pdf_cm as f:
+        if MultipartEncoder is None:
+            files = {"files": (pdf_name, f, "application/pdf")}
+            resp = _SESSION.post(
+                endpoint, data=form_fields, files=files, stream=True, timeout=timeout_s
+            )
+        else:
+            encoder = MultipartEncoder(
+                fields={**form_fields, "files": (pdf_name, f, "application/pdf")}
+            )
+            resp = _SESSION.post(
+                endpoint,
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
+                stream=True,
+                timeout=timeout_s,
+            )
 
     if not resp.ok:
-        # Preserve payload in exception for debugging (truncated)
-        snippet = resp.text
-        if len(snippet) > 10_000:
-            snippet = snippet[:10_000] + "\n... (truncated) ..."
-        raise RuntimeError(f"Self-hosted MinerU error HTTP {resp.status_code}: {snippet}")
+        # Preserve payload in exception for debugging; only the first
+        # _ERROR_SNIPPET_SIZE bytes are read from the stream
+        try:
+            payload = resp.raw.read(_ERROR_SNIPPET_SIZE + 1, decode_content=True)
+        finally:
+            resp.close()
+        snippet = payload[:_ERROR_SNIPPET_SIZE].decode("utf-8", errors="replace")
+        if len(payload) > _ERROR_SNIPPET_SIZE:
+            snippet += "\n... (truncated) ..."
+        content_type = resp.headers.get("Content-Type", "unknown")
+        raise RuntimeError(
+            f"Self-hosted MinerU error HTTP {resp.status_code} ({content_type}): {snippet}"
+        )
 
-    return resp.content
+    return resp
 
 
 def parse_pdf_via_self_hosted_mineru(
-    pdf_path: Path,
+    pdf_source: Union[Path, BinaryIO],
     *,
     mineru_api_base: str,
     upload_folder: Path,
     output_dir_field: str = "./output",
     timeout_s: int = 300,
     form_overrides: Optional[Dict[str, str]] = None,
+    pdf_name: Optional[str] = None,
 ) -> Tuple[str, Path]:
     """
     Parse a PDF via the self-hosted MinerU `/file_parse` API, save/unzip the ZIP
     response into <upload_folder>/mineru_files/<extract_id>/, and return:
       (extract_id, extract_dir)
+
+    `pdf_source` may be a path or an already-open binary stream (e.g. an HTTP
+    upload), which is sent without first copying it to disk. For a stream,
+    `pdf_name` gives the uploaded filename; it defaults to the stream's
+    `name` attribute when that is a path.
     """
     endpoint = resolve_self_hosted_endpoint(mineru_api_base)
-    pdf_path = pdf_path.expanduser().resolve()
-    upload_folder = upload_folder.expanduser().resolve()
 
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    if hasattr(pdf_source, "read"):
+        if not pdf_name:
+            stream_name = getattr(pdf_source, "name", None)
+            pdf_name = os.path.basename(stream_name) if isinstance(stream_name, str) else None
+        if not pdf_name:
+            raise ValueError("pdf_name is required when pdf_source is a file object")
+    else:
+        pdf_source = Path(pdf_source).expanduser().resolve()
+        if not pdf_source.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_source}")
+        pdf_name = pdf_name or pdf_source.name
+    pdf_stem = Path(pdf_name).stem
 
     extract_id = uuid.uuid4().hex[:8]
-    extract_dir = upload_folder / "mineru_files" / extract_id
-    extract_dir.mkdir(parents=True, exist_ok=True)
+    extract_dir = _mineru_files_dir(upload_folder) / extract_id
+    try:
+        extract_dir.mkdir(exist_ok=True)
+    except FileNotFoundError:
+        # mineru_files was removed after this process first created it
+        extract_dir.mkdir(parents=True, exist_ok=True)
 
     # Mirror scratchpad/test_mineru_curl.sh defaults
     fields: Dict[str, str] = {
@@ -201,37 +457,55 @@ def parse_pdf_via_self_hosted_mineru(
     if form_overrides:
         fields.update({k: str(v) for k, v in form_overrides.items()})
 
-    content = _post_file_parse(
+    resp = _post_file_parse(
         endpoint=endpoint,
-        pdf_path=pdf_path,
+        pdf_source=pdf_source,
+        pdf_name=pdf_name,
         form_fields=fields,
         timeout_s=timeout_s,
     )
 
-    zip_path = extract_dir / f"{pdf_path.stem}-mineru-{_timestamp()}.zip"
-    zip_path.write_bytes(content)
-
-    if not zipfile.is_zipfile(BytesIO(content)):
-        sniff = content[:5000].decode("utf-8", errors="replace")
-        raise RuntimeError(
-            "Self-hosted MinerU returned non-zip payload. "
-            f"Saved to {zip_path}. Snippet:\n{sniff}"
-        )
-
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        _safe_extractall(zf, extract_dir)
-
-    _flatten_single_top_level_dir(extract_dir)
-    _ensure_layout_json_from_middle_json(extract_dir=extract_dir, pdf_stem=pdf_path.stem)
+    # Spool the archive in memory (spilling to a temp file once it grows large)
+    # and extract straight from it; the ZIP is only written under extract_dir
+    # for debugging when MINERU_KEEP_ZIP=1.
+    zip_path: Optional[Path] = None
+    if os.environ.get("MINERU_KEEP_ZIP") == "1":
+        zip_path = extract_dir / f"{pdf_stem}-mineru-{_timestamp()}.zip"
+        archive = zip_path.open("w+b")
+    else:
+        archive = _ZipSpool(max_size=_SPOOL_MAX_SIZE)
+
+    with archive:
+        with resp:
+            for chunk in resp.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                archive.write(chunk)
+
+        archive.seek(0)
+        if not zipfile.is_zipfile(archive):
+            archive.seek(0)
+            sniff = archive.read(5000).decode("utf-8", errors="replace")
+            saved = f"Saved to {zip_path}. " if zip_path else ""
+            raise RuntimeError(
+                "Self-hosted MinerU returned non-zip payload. "
+                f"{saved}Snippet:\n{sniff}"
+            )
+
+        archive.seek(0)
+        with zipfile.ZipFile(archive, "r") as zf:
+            _safe_extractall(zf, extract_dir)
+
+    # One directory listing is shared by the post-processing steps below
+    entries = _scan_once(extract_dir)
+    if _flatten_single_top_level_dir(extract_dir, entries):
+        entries = _scan_once(extract_dir)
+    _ensure_layout_json_from_middle_json(
+        extract_dir=extract_dir, pdf_stem=pdf_stem, entries=entries
+    )
 
     # Validate expected artifacts exist
-    content_list_files = list(extract_dir.glob("*_content_list.json"))
-    if not content_list_files:
+    if not any(entry.name.endswith("_content_list.json") for entry in entries):
         # Provide a short directory listing to aid debugging
-        entries = sorted([p.relative_to(extract_dir).as_posix() for p in extract_dir.rglob("*")])
-        preview = "\n".join(entries[:200])
-        if len(entries) > 200:
-            preview += "\n... (truncated) ..."
+        preview = _listing_preview(extract_dir)
         raise RuntimeError(
             "Self-hosted MinerU ZIP extracted, but no *_content_list.json was found under "
             f"{extract_dir}.\nExtracted entries:\n{preview}"
@@ -4,16 +4,81 @@ Template Style Extractor - Extract font and color styles from PPTX template file
 Uses the existing templates/inventory.py to parse template files and extract
 font information from placeholders.
 """
+import functools
+import importlib.util
 import logging
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
 logger = logging.getLogger(__name__)
 
+# templates/inventory.py is loaded from here on first use (see _load_inventory_module)
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / 'templates'
+_inventory_mod = None
+
+# Placeholder types that map to each font category
+_TITLE_TYPES = frozenset({'TITLE', 'CENTER_TITLE'})
+_BODY_TYPES = frozenset({'BODY', 'SUBTITLE', 'FOOTER'})
+
+
+def _load_inventory_module():
+    """Load templates/inventory.py once, without modifying sys.path."""
+    global _inventory_mod
+    if _inventory_mod is None:
+        inventory_path = _TEMPLATES_DIR / 'inventory.py'
+        if not inventory_path.is_file():
+            raise ImportError(f"No inventory module at {inventory_path}")
+        spec = importlib.util.spec_from_file_location('inventory', inventory_path)
+        module = importlib.util.module_from_spec(spec)
+        # The module's dataclasses look the module up in sys.modules while it executes
+        sys.modules[spec.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            sys.modules.pop(spec.name, None)
+            raise
+        _inventory_mod = module
+    return _inventory_mod
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color(color_str: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse color string from inventory to RGB tuple.
+
+    Templates reuse a handful of colors, so results are cached.
+
+    Args:
+        color_str: Color string (e.g., "FF0000" for red)
+
+    Returns:
+        RGB tuple (r, g, b) or None
+    """
+    if not color_str:
+        return None
 
-@dataclass
+    try:
+        # Remove any leading # if present
+        color_str = color_str.lstrip('#')
+
+        # Parse as hex
+        if len(color_str) == 6:
+            return tuple(bytes.fromhex(color_str))
+    except (ValueError, IndexError):
+        pass
+
+    return None
+
+
+def _iter_shapes(inventory):
+    """Yield every shape's data from a text inventory, slide by slide."""
+    for slide_data in inventory.values():
+        yield from slide_data.values()
+
+
+@dataclass(frozen=True, slots=True)
 class FontStyle:
     """Font style configuration for a text category (title or body)"""
     name: str                                      # Font family name (e.g., "HPE Graphik")
@@ -23,22 +88,41 @@ class FontStyle:
     color_rgb: Optional[Tuple[int, int, int]] = None  # RGB color tuple (r, g, b)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StyleConfig:
     """Complete style configuration extracted from templates"""
-    title_font: FontStyle = field(default_factory=lambda: FontStyle(
+    # FontStyle is immutable, so the defaults can be shared between instances
+    title_font: FontStyle = FontStyle(
         name="Arial",
         bold=True
-    ))
-    body_font: FontStyle = field(default_factory=lambda: FontStyle(
+    )
+    body_font: FontStyle = FontStyle(
         name="Arial",
         bold=False
-    ))
+    )
 
     # Source template info (for debugging)
     source_template: Optional[str] = None
 
 
+# HPE brand defaults, used when templates cannot be parsed or as fallback
+_HPE_DEFAULT = StyleConfig(
+    title_font=FontStyle(
+        name="HPE Graphik Semibold",
+        fallback_name="Arial",
+        bold=True,
+        color_rgb=None  # Use default black
+    ),
+    body_font=FontStyle(
+        name="HPE Graphik",
+        fallback_name="Arial",
+        bold=False,
+        color_rgb=None  # Use default black
+    ),
+    source_template="HPE defaults"
+)
+
+
 class TemplateStyleExtractor:
     """
     Extract font and color styles from PPTX template files.
@@ -53,6 +137,9 @@ class TemplateStyleExtractor:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Extracted styles keyed by (template path, mtime_ns, size); an edited
+        # template gets a new key, so stale entries are never returned
+        self._cache: Dict[Tuple[str, int, int], StyleConfig] = {}
 
     def extract_styles(
         self,
@@ -71,20 +158,17 @@ class TemplateStyleExtractor:
         """
         template_path = Path(template_dir) / content_template
 
-        if not template_path.exists():
-            self.logger.warning(f"Template not found: {template_path}, using HPE defaults")
-            return self.get_hpe_default_style()
-
         try:
-            # Import inventory module from templates directory
-            templates_dir = Path(__file__).parent.parent / 'templates'
-            if str(templates_dir) not in sys.path:
-                sys.path.insert(0, str(templates_dir))
-
-            from inventory import extract_text_inventory
+            # A missing template surfaces as FileNotFoundError from stat() or,
+            # if it disappears in between, from the inventory parse itself
+            st = template_path.stat()
+            cache_key = (str(template_path), st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
             # Extract text inventory from template
-            inventory = extract_text_inventory(template_path)
+            inventory = _load_inventory_module().extract_text_inventory(template_path)
 
             # Initialize with defaults
             title_font_name = None
@@ -94,128 +178,79 @@ class TemplateStyleExtractor:
             body_font_bold = None
             body_font_color = None
 
-            # Scan placeholders for font information
-            for slide_key, slide_data in inventory.items():
-                for shape_key, shape_data in slide_data.items():
-                    placeholder_type = shape_data.placeholder_type
-                    paragraphs = shape_data.paragraphs
-
-                    if not paragraphs:
-                        continue
-
-                    # Get first paragraph's font info
-                    first_para = paragraphs[0]
-                    font_name = first_para.font_name
-                    font_bold = first_para.bold
-                    font_color = self._parse_color(first_para.color)
-
-                    if not font_name:
-                        continue
-
-                    # Map placeholder type to font category
-                    if placeholder_type in ['TITLE', 'CENTER_TITLE']:
-                        if not title_font_name:  # Take first match
-                            title_font_name = font_name
-                            title_font_bold = font_bold
-                            title_font_color = font_color
-                            self.logger.debug(f"Found title font: {font_name} from {placeholder_type}")
-
-                    elif placeholder_type in ['BODY', 'SUBTITLE', 'FOOTER']:
-                        if not body_font_name:  # Take first match
-                            body_font_name = font_name
-                            body_font_bold = font_bold
-                            body_font_color = font_color
-                            self.logger.debug(f"Found body font: {font_name} from {placeholder_type}")
-
-            # Build StyleConfig
-            config = StyleConfig(source_template=str(template_path))
-
-            if title_font_name:
-                config.title_font = FontStyle(
+            # Scan placeholders for font information, stopping once both are found
+            for shape_data in _iter_shapes(inventory):
+                placeholder_type = shape_data.placeholder_type
+                paragraphs = shape_data.paragraphs
+
+                if not paragraphs:
+                    continue
+
+                # Get first paragraph's font info
+                first_para = paragraphs[0]
+                font_name = first_para.font_name
+                font_bold = first_para.bold
+                font_color = _parse_color(first_para.color)
+
+                if not font_name:
+                    continue
+
+                # Map placeholder type to font category
+                if placeholder_type in _TITLE_TYPES:
+                    if not title_font_name:  # Take first match
+                        title_font_name = font_name
+                        title_font_bold = font_bold
+                        title_font_color = font_color
+                        self.logger.debug("Found title font: %s from %s", font_name, placeholder_type)
+
+                elif placeholder_type in _BODY_TYPES:
+                    if not body_font_name:  # Take first match
+                        body_font_name = font_name
+                        body_font_bold = font_bold
+                        body_font_color = font_color
+                        self.logger.debug("Found body font: %s from %s", font_name, placeholder_type)
+
+                if title_font_name and body_font_name:
+                    break
+
+            # Build StyleConfig, using HPE defaults for any font not found
+            config = StyleConfig(
+                title_font=FontStyle(
                     name=title_font_name,
                     bold=title_font_bold if title_font_bold is not None else True,
                     color_rgb=title_font_color
-                )
-            else:
-                # Use HPE default for title
-                config.title_font = FontStyle(
-                    name="HPE Graphik Semibold",
-                    bold=True
-                )
-
-            if body_font_name:
-                config.body_font = FontStyle(
+                ) if title_font_name else _HPE_DEFAULT.title_font,
+                body_font=FontStyle(
                     name=body_font_name,
                     bold=body_font_bold if body_font_bold is not None else False,
                     color_rgb=body_font_color
-                )
-            else:
-                # Use HPE default for body
-                config.body_font = FontStyle(
-                    name="HPE Graphik",
-                    bold=False
-                )
-
-            self.logger.info(f"Extracted styles from {template_path}")
-            self.logger.info(f"  Title font: {config.title_font.name} (bold={config.title_font.bold})")
-            self.logger.info(f"  Body font: {config.body_font.name} (bold={config.body_font.bold})")
+                ) if body_font_name else _HPE_DEFAULT.body_font,
+                source_template=str(template_path)
+            )
+
+            self.logger.info("Extracted styles from %s", template_path)
+            self.logger.info("  Title font: %s (bold=%s)", config.title_font.name, config.title_font.bold)
+            self.logger.info("  Body font: %s (bold=%s)", config.body_font.name, config.body_font.bold)
 
+            self._cache[cache_key] = config
             return config
 
+        except FileNotFoundError:
+            self.logger.warning("Template not found: %s, using HPE defaults", template_path)
+            return self.get_hpe_default_style()
         except ImportError as e:
-            self.logger.warning(f"Could not import inventory module: {e}, using HPE defaults")
+            self.logger.warning("Could not import inventory module: %s, using HPE defaults", e)
             return self.get_hpe_default_style()
         except Exception as e:
-            self.logger.warning(f"Failed to extract styles from {template_path}: {e}, using HPE defaults")
+            self.logger.warning("Failed to extract styles from %s: %s, using HPE defaults", template_path, e)
             return self.get_hpe_default_style()
 
-    def _parse_color(self, color_str: Optional[str]) -> Optional[Tuple[int, int, int]]:
-        """
-        Parse color string from inventory to RGB tuple.
-
-        Args:
-            color_str: Color string (e.g., "FF0000" for red)
-
-        Returns:
-            RGB tuple (r, g, b) or None
-        """
-        if not color_str:
-            return None
-
-        try:
-            # Remove any leading # if present
-            color_str = color_str.lstrip('#')
-
-            # Parse as hex
-            if len(color_str) == 6:
-                r = int(color_str[0:2], 16)
-                g = int(color_str[2:4], 16)
-                b = int(color_str[4:6], 16)
-                return (r, g, b)
-        except (ValueError, IndexError):
-            pass
-
-        return None
-
     @staticmethod
     def get_hpe_default_style() -> StyleConfig:
         """
         Return HPE brand default style configuration.
 
-        Use this when templates cannot be parsed or as fallback.
+        Use this when templates cannot be parsed or as fallback. The returned
+        config is shared and immutable.
         """
-        return StyleConfig(
-            title_font=FontStyle(
-                name="HPE Graphik Semibold",
-                fallback_name="Arial",
-                bold=True,
-                color_rgb=None  # Use default black
-            ),
-            body_font=FontStyle(
-                name="HPE Graphik",
-                fallback_name="Arial",
-                bold=False,
-                color_rgb=None  # Use default black
-            ),
-            source_template="HPE defaults"
-        )
+        return _HPE_DEFAULT